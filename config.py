@@ -5,6 +5,7 @@ PROMPT_SERVICE_HOST = "0.0.0.0"
 
 # Nami connection (we deliver interjections here)
 NAMI_INTERJECT_URL = "http://localhost:8000/funnel/interject"
+NAMI_STOP_AUDIO_URL = "http://localhost:8000/stop_audio"  # Kill TTS playback on interrupt
 
 # Director Engine (we fetch context from here before forwarding to Nami)
 DIRECTOR_URL = "http://localhost:8006"
@@ -17,4 +18,39 @@ POST_RESPONSE_COOLDOWN = 10.0    # Cooldown after Nami responds to user
 
 # Context fetch timeout — if director doesn't respond in time, fall back to
 # sending req.content alone so Nami still fires rather than silently failing
-DIRECTOR_CONTEXT_TIMEOUT = 3.0
\ No newline at end of file
+DIRECTOR_CONTEXT_TIMEOUT = 3.0
+
+# Per-request HTTP timeouts (seconds), keyed by call site
+HTTP_TIMEOUTS = {
+    "director": DIRECTOR_CONTEXT_TIMEOUT,  # Director /context fetch
+    "nami": 2.0,                           # Nami /funnel/interject delivery
+    "stop": 1.0,                           # Nami /stop_audio on interrupt
+}
+
+# Upper bound on acquiring a connection (pool wait + TCP connect), per call
+HTTP_CONNECT_TIMEOUT = 2.0
+
+# Director context cache — brain retries of the same event (and interrupts
+# re-requesting context) within this window reuse the last fetched block
+DIRECTOR_CONTEXT_CACHE_TTL = 2.0
+DIRECTOR_CONTEXT_CACHE_SIZE = 128
+
+# Logging — "DEBUG" shows per-request chatter (context fetches, deliveries),
+# "INFO" shows state changes, None silences the service entirely (production)
+LOG_LEVEL = "INFO"
+
+# Idle keep-alive for pooled connections to Director/Nami (seconds)
+HTTP_KEEPALIVE_TIMEOUT = 60.0
+
+# Director circuit breaker — after this many consecutive connect failures or
+# timeouts, skip the fetch entirely (send without context) for the cooldown
+DIRECTOR_BREAKER_THRESHOLD = 3
+DIRECTOR_BREAKER_COOLDOWN = 15.0
+
+# Gated /speak requests are delivered to Nami by a single worker; when this
+# many are already waiting, new ones are turned away instead of piling up
+DISPATCH_QUEUE_SIZE = 64
+
+# Only these triggers get the full Director context block; anything else
+# (dead_air, low-priority thoughts, ...) skips the /context round-trip
+TRIGGERS_NEEDING_CONTEXT = {"skill_issue", "reactive", "interrupt", "direct_mention"}
@@ -18,11 +18,20 @@ Director (brain): 8006
 Nami:  8000
 """
 
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
 import uvicorn
-import httpx
-from fastapi import FastAPI
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+import aiohttp
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
+from typing import Dict, Any, Hashable, Optional, Tuple, Type, TypeVar
 
 import config
 from speech_gate import SpeechGate
@@ -30,16 +39,55 @@ from speech_gate import SpeechGate
 # =====================================================
 # APP SETUP
 # =====================================================
-app = FastAPI(title="Nami Prompt Service")
+
+class OrjsonResponse(Response):
+    """JSON response rendered with orjson (FastAPI's ORJSONResponse is deprecated)."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """App lifetime — see _startup / _shutdown under LIFECYCLE."""
+    await _startup(app)
+    try:
+        yield
+    finally:
+        await _shutdown(app)
+
+
+app = FastAPI(
+    title="Nami Prompt Service",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
+)
 gate = SpeechGate(config)
-http_client: Optional[httpx.AsyncClient] = None
+log = logging.getLogger("prompt_service")
+
+# Strong refs to fire-and-forget tasks so they aren't GC'd mid-flight
+_bg_tasks: set = set()
+
+# Built once at import rather than on every call
+_DIRECTOR_CTX_URL = f"{config.DIRECTOR_URL}/context"
+# connect also covers waiting for a free pooled connection, so a saturated
+# pool can't eat a call's whole budget before the request is even sent
+_TIMEOUTS = {
+    name: aiohttp.ClientTimeout(total=seconds, connect=config.HTTP_CONNECT_TIMEOUT)
+    for name, seconds in config.HTTP_TIMEOUTS.items()
+}
+
+# Outbound bodies are pre-encoded with msgspec (not orjson — metadata can
+# carry integers beyond 64 bits, which orjson rejects) and sent as raw data
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 # =====================================================
 # MODELS
 # =====================================================
 
-class SpeakRequest(BaseModel):
+class SpeakRequest(msgspec.Struct):
     """Inbound from the brain."""
     trigger: str           # "skill_issue", "thought", "reactive", "interrupt", "dead_air", etc.
     content: str           # The interjection trigger / instruction for Nami
@@ -47,34 +95,66 @@ class SpeakRequest(BaseModel):
     source: str = "DIRECTOR"
     is_interrupt: bool = False
     event_id: Optional[str] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
 
 
-class SpeechStatePayload(BaseModel):
+class SpeechStatePayload(msgspec.Struct):
     """Inbound from Nami's TTS."""
     source: Optional[str] = None
 
 
+class DirectorCtx(msgspec.Struct):
+    """Response from the Director's /context. Unknown keys are ignored."""
+    context: Optional[str] = None      # Full structured prompt block
+    mood: Optional[str] = None
+    scene: Optional[str] = None
+    directive: Optional[str] = None
+    active_user: Optional[str] = None
+
+
+_T = TypeVar("_T")
+
+
+async def _decode_body(request: Request, model: Type[_T], allow_empty: bool = False) -> _T:
+    """
+    Decode a JSON request body straight into a msgspec Struct.
+
+    Bad payloads get a 422, same as FastAPI's own validation would give.
+    allow_empty lets body-optional endpoints fall back to the defaults.
+    """
+    body = await request.body()
+    if not body and allow_empty:
+        return model()
+    try:
+        return msgspec.json.decode(body, type=model)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
 # =====================================================
 # ENDPOINTS — Brain → Prompt Service
 # =====================================================
 
 @app.post("/speak")
-async def handle_speak(req: SpeakRequest):
+async def handle_speak(request: Request):
     """
     The brain pushes ALL speech requests here.
     We gate them and forward survivors to Nami — with full context attached.
     """
+    req = await _decode_body(request, SpeakRequest)
+    http = request.app.state.http
+
     # --- INTERRUPT PATH (bypasses normal gates) ---
     if req.is_interrupt:
         was_speaking = gate.interrupt(reason=req.trigger)
 
-        # If she was speaking, signal Nami's TTS to stop
+        # If she was speaking, signal Nami's TTS to stop. Runs in the
+        # background — the brain doesn't need its result
         if was_speaking:
-            await _signal_nami_interrupt(req.trigger)
+            _spawn_background(_signal_nami_interrupt(http, req.trigger))
 
         # Forward the interrupt interjection (with context)
-        success = await _forward_to_nami(req)
+        success = await _forward_to_nami(http, req)
         return {
             "delivered": success,
             "interrupted": was_speaking,
@@ -83,21 +163,24 @@ async def handle_speak(req: SpeakRequest):
 
     # --- NORMAL PATH (full gate check) ---
 
-    # Dedup check
-    if gate.check_event_reacted(req.event_id):
-        return {"delivered": False, "gate_result": "already_reacted"}
-
-    # Run gates
-    check = gate.can_speak()
+    # Dedup + gates, atomically reserving the dispatch slot if allowed
+    check = await gate.try_dispatch(event_id=req.event_id)
     if not check["allowed"]:
-        print(f"🚫 [Gate] Blocked: {check['reason']} | {req.trigger}: {req.content[:40]}...")
+        if check["reason"] != "already_reacted":
+            log.debug("🚫 [Gate] Blocked: %s | %s: %.40s...", check["reason"], req.trigger, req.content)
         return {"delivered": False, "gate_result": check["reason"]}
 
-    # All gates passed — enrich with context and forward to Nami
-    success = await _forward_to_nami(req)
+    # All gates passed — hand off to the dispatch worker and wait for Nami
+    try:
+        fut = asyncio.get_running_loop().create_future()
+        request.app.state.dispatch_q.put_nowait((req, check["reserved_at"], fut))
+    except asyncio.QueueFull:
+        await gate.release_dispatch(req.event_id, check["reserved_at"])
+        log.warning("⚠️ [Prompt] Dispatch queue full — dropping %s", req.trigger)
+        return {"delivered": False, "gate_result": "queue_full"}
 
-    if success:
-        gate.register_dispatch(event_id=req.event_id)
+    # shield: if the brain disconnects, the worker still delivers
+    success = await asyncio.shield(fut)
 
     return {
         "delivered": success,
@@ -124,8 +207,9 @@ async def register_bot_response():
 # =====================================================
 
 @app.post("/speech_started")
-async def speech_started(payload: SpeechStatePayload = SpeechStatePayload()):
+async def speech_started(request: Request):
     """Nami's TTS reports: started speaking."""
+    payload = await _decode_body(request, SpeechStatePayload, allow_empty=True)
     gate.set_speaking(True, source=payload.source)
     return {"status": "ok"}
 
@@ -167,7 +251,78 @@ async def speech_state():
 # INTERNAL — Context Fetch from Director
 # =====================================================
 
-async def _fetch_director_context(req: SpeakRequest) -> Optional[Dict[str, Any]]:
+# key → (fetched_at, DirectorCtx). Oldest entries evicted first.
+_ctx_cache: "OrderedDict[Hashable, Tuple[float, DirectorCtx]]" = OrderedDict()
+
+# key → future for a fetch currently on the wire (single-flight)
+_inflight: Dict[Hashable, asyncio.Future] = {}
+
+# Circuit breaker: while open, don't wait on a Director that's down
+_director_fail_count: int = 0
+_director_open_until: float = 0.0
+
+
+def _record_director_failure():
+    global _director_fail_count, _director_open_until
+    _director_fail_count += 1
+    if _director_fail_count >= config.DIRECTOR_BREAKER_THRESHOLD:
+        # Count is kept (reset only on a response) so a single failed probe
+        # after the cooldown reopens the breaker straight away
+        _director_open_until = time.monotonic() + config.DIRECTOR_BREAKER_COOLDOWN
+        log.warning(
+            "⚠️ [Prompt] Director failing — skipping context fetches for %ss",
+            config.DIRECTOR_BREAKER_COOLDOWN,
+        )
+
+
+def _director_timed_out():
+    log.warning(
+        "⚠️ [Prompt] Director /context timed out (%ss) — sending without context",
+        config.HTTP_TIMEOUTS["director"],
+    )
+    _record_director_failure()
+
+
+def _context_key(req: SpeakRequest) -> Optional[Hashable]:
+    """Cache key for a context request, or None if it can't be keyed."""
+    if req.event_id:
+        return req.event_id
+    # The tuple itself is the key (not its hash) so distinct payloads never
+    # share an entry; value types are included because 1 == 1.0 == True
+    key = (
+        req.trigger,
+        tuple((k, type(v), v) for k, v in sorted(req.metadata.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable metadata values (nested dicts/lists) — don't cache
+        return None
+    return key
+
+
+def _cache_get(key: Hashable) -> Optional[DirectorCtx]:
+    entry = _ctx_cache.get(key)
+    if entry is None:
+        return None
+    ts, data = entry
+    if time.monotonic() - ts >= config.DIRECTOR_CONTEXT_CACHE_TTL:
+        del _ctx_cache[key]
+        return None
+    return data
+
+
+def _cache_put(key: Hashable, data: DirectorCtx):
+    _ctx_cache[key] = (time.monotonic(), data)
+    _ctx_cache.move_to_end(key)
+    while len(_ctx_cache) > config.DIRECTOR_CONTEXT_CACHE_SIZE:
+        _ctx_cache.popitem(last=False)
+
+
+async def _fetch_director_context(
+    http: aiohttp.ClientSession,
+    req: SpeakRequest,
+) -> Optional[DirectorCtx]:
     """
     Call the Director's /context endpoint to get the full structured prompt.
 
@@ -175,14 +330,71 @@ async def _fetch_director_context(req: SpeakRequest) -> Optional[Dict[str, Any]]
     context to the specific speech event (e.g. a skill issue vs dead air
     may result in different memory retrieval or detail levels).
 
-    Returns the full context dict, or None if the director is unreachable
+    Returns the decoded context, or None if the director is unreachable
     or times out — caller falls back to sending trigger-only content so
     Nami still fires rather than silently dropping the request.
+
+    Successful responses are cached briefly (DIRECTOR_CONTEXT_CACHE_TTL)
+    so brain retries of the same event don't re-hit the Director, and
+    concurrent requests for the same key share a single in-flight fetch.
     """
-    global http_client
-    if not http_client:
+    key = _context_key(req)
+    if key is None:
+        return await _request_director_context(http, req)
+
+    cached = _cache_get(key)
+    if cached is not None:
+        log.debug("📋 [Prompt] Context cache hit for %s", req.trigger)
+        return cached
+
+    # Someone is already fetching this exact context — wait for their result
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        # shield: a cancelled waiter must not cancel the shared future
+        return await asyncio.shield(inflight)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    data = None
+    try:
+        data = await _request_director_context(http, req)
+        if data is not None:
+            _cache_put(key, data)
+        return data
+    finally:
+        # Always resolve so waiters never hang (None = fall back, same as
+        # a failed fetch), even if this coroutine was cancelled mid-request
+        if not fut.done():
+            fut.set_result(data)
+        _inflight.pop(key, None)
+
+
+async def _request_director_context(
+    http: aiohttp.ClientSession,
+    req: SpeakRequest,
+) -> Optional[DirectorCtx]:
+    """Do the actual POST to the Director. Never raises — None on failure."""
+    if time.monotonic() < _director_open_until:
+        return None
+
+    # Outer deadline on top of the client timeout so the caller's wait is
+    # bounded no matter what the connection pool is doing
+    try:
+        return await asyncio.wait_for(
+            _post_director_context(http, req),
+            timeout=config.HTTP_TIMEOUTS["director"] + 0.5,
+        )
+    except asyncio.TimeoutError:
+        _director_timed_out()
         return None
 
+
+async def _post_director_context(
+    http: aiohttp.ClientSession,
+    req: SpeakRequest,
+) -> Optional[DirectorCtx]:
+    """The POST itself, bounded by the client timeout."""
+    global _director_fail_count
     payload = {
         "trigger": req.trigger,
         "event_id": req.event_id,
@@ -190,31 +402,37 @@ async def _fetch_director_context(req: SpeakRequest) -> Optional[Dict[str, Any]]
     }
 
     try:
-        response = await http_client.post(
-            f"{config.DIRECTOR_URL}/context",
-            json=payload,
-            timeout=config.DIRECTOR_CONTEXT_TIMEOUT,
-        )
-        if response.status_code == 200:
-            data = response.json()
-            print(
-                f"📋 [Prompt] Got context from Director "
-                f"({len(data.get('context', ''))} chars, "
-                f"scene={data.get('scene', '?')}, "
-                f"mood={data.get('mood', '?')})"
-            )
-            return data
-        else:
-            print(f"⚠️ [Prompt] Director /context returned {response.status_code}")
-            return None
-    except httpx.ConnectError:
-        print(f"⚠️ [Prompt] Director unreachable at {config.DIRECTOR_URL} — sending without context")
+        async with http.post(
+            _DIRECTOR_CTX_URL,
+            data=msgspec.json.encode(payload),
+            headers=_JSON_HEADERS,
+            timeout=_TIMEOUTS["director"],
+        ) as response:
+            # Any response at all means the Director is up
+            _director_fail_count = 0
+            if response.status == 200:
+                # Typed decode — only the fields Nami needs are materialised
+                data = msgspec.json.decode(await response.read(), type=DirectorCtx)
+                log.debug(
+                    "📋 [Prompt] Got context from Director (%d chars, scene=%s, mood=%s)",
+                    len(data.context or ""), data.scene or "?", data.mood or "?",
+                )
+                return data
+            else:
+                log.warning("⚠️ [Prompt] Director /context returned %s", response.status)
+                return None
+    except aiohttp.ClientConnectorError:
+        log.warning("⚠️ [Prompt] Director unreachable at %s — sending without context", config.DIRECTOR_URL)
+        _record_director_failure()
         return None
-    except httpx.TimeoutException:
-        print(f"⚠️ [Prompt] Director /context timed out ({config.DIRECTOR_CONTEXT_TIMEOUT}s) — sending without context")
+    except asyncio.TimeoutError:
+        _director_timed_out()
+        return None
+    except msgspec.ValidationError as e:
+        log.warning("⚠️ [Prompt] Director /context response didn't match DirectorCtx: %s", e)
         return None
     except Exception as e:
-        print(f"⚠️ [Prompt] Context fetch error: {e}")
+        log.warning("⚠️ [Prompt] Context fetch error: %s", e)
         return None
 
 
@@ -222,7 +440,19 @@ async def _fetch_director_context(req: SpeakRequest) -> Optional[Dict[str, Any]]
 # INTERNAL — Delivery to Nami
 # =====================================================
 
-async def _forward_to_nami(req: SpeakRequest) -> bool:
+# Director state passed through to Nami's source_info (all None without context)
+_EMPTY_DIRECTOR_FIELDS: Dict[str, Any] = {
+    "mood": None,
+    "scene": None,
+    "directive": None,
+    "active_user": None,
+}
+
+
+async def _forward_to_nami(
+    http: aiohttp.ClientSession,
+    req: SpeakRequest,
+) -> bool:
     """
     Fetch full context from the Director, then forward the enriched
     interjection to Nami's funnel.
@@ -236,18 +466,31 @@ async def _forward_to_nami(req: SpeakRequest) -> bool:
 
     If the director is down we fall back to sending content alone so
     Nami still fires rather than silently dropping the request.
+    Triggers outside TRIGGERS_NEEDING_CONTEXT skip the fetch entirely.
     """
-    global http_client
-    if not http_client:
-        print("❌ [Prompt] No HTTP client!")
-        return False
-
-    # --- Fetch context from Director ---
-    director_data = await _fetch_director_context(req)
-    context_block = director_data.get("context", "") if director_data else ""
+    # --- Fetch context from Director (only for triggers that use it) ---
+    needs_context = req.trigger in config.TRIGGERS_NEEDING_CONTEXT
+    if needs_context:
+        director_data = await _fetch_director_context(http, req)
+    else:
+        log.debug("📋 [Prompt] Skipping context fetch for trigger: %s", req.trigger)
+        director_data = None
+
+    if director_data is not None:
+        context_block = director_data.context or ""
+        director_fields = {
+            "mood": director_data.mood,
+            "scene": director_data.scene,
+            "directive": director_data.directive,
+            "active_user": director_data.active_user,
+        }
+    else:
+        context_block = ""
+        director_fields = _EMPTY_DIRECTOR_FIELDS
 
-    if not context_block:
-        print(f"⚠️ [Prompt] No context block — Nami will use base personality for: {req.trigger}")
+    # Only worth flagging when we asked and got nothing back
+    if needs_context and not context_block:
+        log.info("⚠️ [Prompt] No context block — Nami will use base personality for: %s", req.trigger)
 
     # --- Build payload for Nami ---
     payload = {
@@ -261,77 +504,161 @@ async def _forward_to_nami(req: SpeakRequest) -> bool:
             "use_tts": True,
             "is_interrupt": req.is_interrupt,
             # Pass through director state so Nami's prompt builder can use it
-            "mood": director_data.get("mood") if director_data else None,
-            "scene": director_data.get("scene") if director_data else None,
-            "directive": director_data.get("directive") if director_data else None,
-            "active_user": director_data.get("active_user") if director_data else None,
+            **director_fields,
             **req.metadata,
         },
     }
 
     try:
-        response = await http_client.post(
+        async with http.post(
             config.NAMI_INTERJECT_URL,
-            json=payload,
-            timeout=2.0,
-        )
-        if response.status_code == 200:
-            print(f"✅ [Prompt] Delivered: {req.trigger} → {req.content[:50]}...")
-            return True
-        else:
-            print(f"❌ [Prompt] Nami rejected: {response.status_code}")
-            return False
-    except httpx.ConnectError:
-        print(f"❌ [Prompt] Cannot reach Nami at {config.NAMI_INTERJECT_URL}")
+            data=msgspec.json.encode(payload),
+            headers=_JSON_HEADERS,
+            timeout=_TIMEOUTS["nami"],
+        ) as response:
+            if response.status == 200:
+                log.info("✅ [Prompt] Delivered: %s → %.50s...", req.trigger, req.content)
+                return True
+            else:
+                log.error("❌ [Prompt] Nami rejected: %s", response.status)
+                return False
+    except aiohttp.ClientConnectorError:
+        log.error("❌ [Prompt] Cannot reach Nami at %s", config.NAMI_INTERJECT_URL)
         return False
     except Exception as e:
-        print(f"❌ [Prompt] Delivery error: {e}")
+        log.error("❌ [Prompt] Delivery error: %s", e)
         return False
 
 
-async def _signal_nami_interrupt(reason: str):
+def _spawn_background(coro) -> asyncio.Task:
+    """Run a coroutine without awaiting it, keeping it alive until done."""
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+    return task
+
+
+async def _signal_nami_interrupt(http: aiohttp.ClientSession, reason: str):
     """
     Tell Nami's TTS to stop immediately.
     This kills the current audio playback via sd.stop() so the
     interrupt interjection can be heard without waiting.
     """
-    global http_client
-    if not http_client:
-        return
-
     try:
-        response = await http_client.post(
-            "http://localhost:8000/stop_audio",
-            timeout=1.0,
-        )
-        if response.status_code == 200:
-            print(f"🛑 [Prompt] Audio killed on Nami (reason: {reason})")
-        else:
-            print(f"⚠️ [Prompt] Stop audio returned {response.status_code}")
+        async with http.post(
+            config.NAMI_STOP_AUDIO_URL,
+            timeout=_TIMEOUTS["stop"],
+        ) as response:
+            if response.status == 200:
+                log.info("🛑 [Prompt] Audio killed on Nami (reason: %s)", reason)
+            else:
+                log.warning("⚠️ [Prompt] Stop audio returned %s", response.status)
     except Exception as e:
-        print(f"⚠️ [Prompt] Failed to stop Nami audio: {e}")
+        log.warning("⚠️ [Prompt] Failed to stop Nami audio: %s", e)
+
+
+# =====================================================
+# INTERNAL — Dispatch Queue
+# =====================================================
+
+async def _dispatch_worker(http: aiohttp.ClientSession, queue: asyncio.Queue):
+    """
+    Single consumer for gated /speak requests.
+
+    Deliveries go out one at a time instead of each handler racing its own
+    Director + Nami round-trip. Failed deliveries give their gate
+    reservation back so the next request isn't blocked by min_interval.
+    """
+    while True:
+        req, reserved_at, fut = await queue.get()
+        success = False
+        try:
+            success = await _forward_to_nami(http, req)
+        except Exception as e:
+            log.error("❌ [Prompt] Dispatch worker error: %s", e)
+        finally:
+            # Resolve even if cancelled mid-delivery (shutdown) so the
+            # waiting /speak handler never hangs on its shielded future
+            if not fut.done():
+                fut.set_result(success)
+            queue.task_done()
+        if not success:
+            await gate.release_dispatch(req.event_id, reserved_at)
 
 
 # =====================================================
 # LIFECYCLE
 # =====================================================
 
-@app.on_event("startup")
-async def startup():
-    global http_client
-    http_client = httpx.AsyncClient()
-    print(f"🎤 Prompt Service ready on port {config.PROMPT_SERVICE_PORT}")
-    print(f"   → Director: {config.DIRECTOR_URL}/context")
-    print(f"   → Nami:     {config.NAMI_INTERJECT_URL}")
+def _configure_logging():
+    """Attach our handler once (entrypoint and startup both call this)."""
+    if log.handlers:
+        return
+    if config.LOG_LEVEL is None:
+        log.addHandler(logging.NullHandler())
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(config.LOG_LEVEL)
+    log.propagate = False
+
+
+async def _startup(app: FastAPI):
+    """
+    Create the shared HTTP session and dispatch worker.
+
+    Both live on app.state; handlers pass the session down to helpers
+    explicitly rather than reaching for a module global.
+    """
+    _configure_logging()
+    # One pooled session for both backends (Director + Nami) so bursts of
+    # /speak calls fan out in parallel instead of queueing on the pool.
+    # Explicit sizing keeps connection counts predictable; timeouts are set
+    # per call (see _TIMEOUTS), which replaces any session-level default.
+    # Both hosts are hit on nearly every /speak, so keep sockets warm
+    # between requests rather than reconnecting each time.
+    http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
+            force_close=False,
+        ),
+    )
+    # Items: (request, reserved_at, result future) — see handle_speak
+    dispatch_q: asyncio.Queue = asyncio.Queue(maxsize=config.DISPATCH_QUEUE_SIZE)
+    app.state.http = http
+    app.state.dispatch_q = dispatch_q
+    app.state.dispatch_worker = asyncio.create_task(_dispatch_worker(http, dispatch_q))
+
+    log.info("🎤 Prompt Service ready on port %s", config.PROMPT_SERVICE_PORT)
+    log.info("   → Director: %s", _DIRECTOR_CTX_URL)
+    log.info("   → Nami:     %s", config.NAMI_INTERJECT_URL)
+
+
+async def _shutdown(app: FastAPI):
+    worker = app.state.dispatch_worker
+    worker.cancel()
+    try:
+        await worker
+    except asyncio.CancelledError:
+        pass
+
+    # Unblock any /speak handlers still waiting on a queued delivery
+    dispatch_q = app.state.dispatch_q
+    while not dispatch_q.empty():
+        _, _, fut = dispatch_q.get_nowait()
+        if not fut.done():
+            fut.set_result(False)
 
+    # Let in-flight stop-audio calls finish (they're short) before the
+    # session they use goes away
+    if _bg_tasks:
+        await asyncio.gather(*_bg_tasks, return_exceptions=True)
 
-@app.on_event("shutdown")
-async def shutdown():
-    global http_client
-    if http_client:
-        await http_client.aclose()
-        http_client = None
-    print("🛑 Prompt Service shut down")
+    await app.state.http.close()
+    log.info("🛑 Prompt Service shut down")
 
 
 # =====================================================
@@ -339,10 +666,14 @@ async def shutdown():
 # =====================================================
 
 if __name__ == "__main__":
-    print("🎤 PROMPT SERVICE (The Mouth) - Starting...")
+    _configure_logging()
+    log.info("🎤 PROMPT SERVICE (The Mouth) - Starting...")
     uvicorn.run(
         app,
         host=config.PROMPT_SERVICE_HOST,
         port=config.PROMPT_SERVICE_PORT,
+        # uvloop has no Windows build — fall back to the stock loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level="warning",
     )
\ No newline at end of file
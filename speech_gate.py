@@ -14,9 +14,14 @@ Gates (in order):
 6. All clear → forward to Nami
 """
 
+import asyncio
+import logging
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 
+log = logging.getLogger("prompt_service.gate")
+
 
 class SpeechGate:
     def __init__(self, config):
@@ -34,9 +39,16 @@ class SpeechGate:
         # --- DISPATCH TRACKING ---
         self.last_dispatch_time: float = 0.0
         self.last_user_response_time: float = 0.0
+        self._prev_dispatch_time: float = 0.0
+
+        # --- CONCURRENCY ---
+        # /speak handlers run as concurrent coroutines; check + register
+        # must be one step or two requests can both slip through the gates
+        self._lock = asyncio.Lock()
 
         # --- DEDUP ---
-        self.reacted_event_ids: set = set()
+        # Insertion-ordered so eviction drops the oldest event, not a random one
+        self.reacted_event_ids: "OrderedDict[str, None]" = OrderedDict()
         self.max_tracked_events: int = 50
 
         # --- CONFIG ---
@@ -53,30 +65,34 @@ class SpeechGate:
         """Called when Nami's TTS starts or stops."""
         self.nami_is_speaking = is_speaking
 
+        now = time.monotonic()
         if is_speaking:
-            self.speech_started_time = time.time()
+            self.speech_started_time = now
             if source:
                 self.last_speech_source = source
-            print(f"🔇 [Gate] Nami started speaking (source: {source})")
+            log.info("🔇 [Gate] Nami started speaking (source: %s)", source)
         else:
-            duration = time.time() - self.speech_started_time if self.speech_started_time else 0
-            self.last_speech_finished_time = time.time()
-            print(
-                f"🔊 [Gate] Nami finished ({duration:.1f}s, was: {self.last_speech_source}) "
-                f"- {self.post_speech_cooldown}s breather"
+            duration = now - self.speech_started_time if self.speech_started_time else 0
+            self.last_speech_finished_time = now
+            log.info(
+                "🔊 [Gate] Nami finished (%.1fs, was: %s) - %ss breather",
+                duration, self.last_speech_source, self.post_speech_cooldown,
             )
             # Clear awaiting — she just replied, breather handles the gap
             if self.awaiting_user_response:
                 self.awaiting_user_response = False
-                print(f"✅ [Gate] Awaiting cleared — replied to user")
+                log.info("✅ [Gate] Awaiting cleared — replied to user")
 
     def is_speaking(self) -> bool:
         """Check if Nami is currently speaking (with timeout failsafe)."""
+        return self._is_speaking(time.monotonic())
+
+    def _is_speaking(self, now: float) -> bool:
         if not self.nami_is_speaking:
             return False
         # Timeout failsafe
-        if self.speech_started_time and (time.time() - self.speech_started_time) > self.speech_timeout:
-            print(f"⚠️ [Gate] Timeout ({self.speech_timeout}s) - forcing unlock")
+        if self.speech_started_time and (now - self.speech_started_time) > self.speech_timeout:
+            log.warning("⚠️ [Gate] Timeout (%ss) - forcing unlock", self.speech_timeout)
             self.nami_is_speaking = False
             self.awaiting_user_response = False
             return False
@@ -84,9 +100,12 @@ class SpeechGate:
 
     def in_cooldown(self) -> bool:
         """Brief breather after Nami finishes speaking."""
+        return self._in_cooldown(time.monotonic())
+
+    def _in_cooldown(self, now: float) -> bool:
         if self.last_speech_finished_time == 0.0:
             return False
-        return (time.time() - self.last_speech_finished_time) < self.post_speech_cooldown
+        return (now - self.last_speech_finished_time) < self.post_speech_cooldown
 
     # =================================================================
     # GATING LOGIC
@@ -98,26 +117,59 @@ class SpeechGate:
         
         This is the core function — every speech request goes through here.
         """
+        now = time.monotonic()
+
         # Gate 1: Never interrupt herself
-        if self.is_speaking():
+        if self._is_speaking(now):
             return {"allowed": False, "reason": "nami_speaking"}
 
         # Gate 2: Post-speech breather (no machine-gun)
-        if self.in_cooldown():
+        if self._in_cooldown(now):
             return {"allowed": False, "reason": "post_speech_cooldown"}
 
-        now = time.time()
-
-        # Gate 3: Min interval since last dispatch
-        if (now - self.last_dispatch_time) < self.min_speech_interval:
+        # Gate 3: Min interval since last dispatch (0.0 = never dispatched)
+        if self.last_dispatch_time and (now - self.last_dispatch_time) < self.min_speech_interval:
             return {"allowed": False, "reason": "min_interval"}
 
         # Gate 4: Post-response cooldown (don't yap right after answering user)
-        if (now - self.last_user_response_time) < self.post_response_cooldown:
+        if self.last_user_response_time and (now - self.last_user_response_time) < self.post_response_cooldown:
             return {"allowed": False, "reason": "post_response_cooldown"}
 
         return {"allowed": True, "reason": "ok"}
 
+    async def try_dispatch(self, event_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Atomically run dedup + all gates and, if they pass, reserve the
+        dispatch (records dispatch time and event_id before releasing).
+
+        Returns the same {"allowed", "reason"} dict as can_speak(), plus
+        "reserved_at" (the reservation's dispatch time) when allowed.
+        Call release_dispatch() with it if delivery to Nami then fails.
+        """
+        async with self._lock:
+            if self.check_event_reacted(event_id):
+                return {"allowed": False, "reason": "already_reacted"}
+
+            check = self.can_speak()
+            if check["allowed"]:
+                self._prev_dispatch_time = self.last_dispatch_time
+                self.register_dispatch(event_id=event_id)
+                check["reserved_at"] = self.last_dispatch_time
+            return check
+
+    async def release_dispatch(self, event_id: Optional[str], reserved_at: float):
+        """
+        Undo a try_dispatch() reservation — Nami never got the request.
+
+        The dispatch time is only rolled back if no later reservation has
+        replaced it; otherwise that newer slot must keep min_interval.
+        """
+        async with self._lock:
+            if self.last_dispatch_time == reserved_at:
+                self.last_dispatch_time = self._prev_dispatch_time
+            if event_id:
+                self.reacted_event_ids.pop(event_id, None)
+
     def check_event_reacted(self, event_id: Optional[str]) -> bool:
         """Returns True if we already reacted to this event."""
         if not event_id:
@@ -130,21 +182,22 @@ class SpeechGate:
 
     def register_dispatch(self, event_id: str = None):
         """Record that we dispatched a speech request."""
-        self.last_dispatch_time = time.time()
+        self.last_dispatch_time = time.monotonic()
         if event_id:
-            self.reacted_event_ids.add(event_id)
+            self.reacted_event_ids[event_id] = None
+            self.reacted_event_ids.move_to_end(event_id)
             if len(self.reacted_event_ids) > self.max_tracked_events:
-                self.reacted_event_ids.pop()
+                self.reacted_event_ids.popitem(last=False)
 
     def register_user_response(self):
         """Brain signals: Nami just responded to a user interaction."""
-        self.last_user_response_time = time.time()
-        print(f"🎯 [Gate] User response registered - cooldown active for {self.post_response_cooldown}s")
+        self.last_user_response_time = time.monotonic()
+        log.info("🎯 [Gate] User response registered - cooldown active for %ss", self.post_response_cooldown)
 
     def clear_user_awaiting(self):
         """Brain signals: user spoke again, stop waiting."""
         if self.awaiting_user_response:
-            print(f"✅ [Gate] User responded - awaiting cleared")
+            log.info("✅ [Gate] User responded - awaiting cleared")
         self.awaiting_user_response = False
 
     # =================================================================
@@ -164,14 +217,14 @@ class SpeechGate:
         """
         was_speaking = self.nami_is_speaking
         self.nami_is_speaking = False
-        self.last_interrupt_time = time.time()
+        self.last_interrupt_time = time.monotonic()
         self.interrupt_count += 1
         self.awaiting_user_response = True
 
         if was_speaking:
-            print(f"🛑 [Gate] INTERRUPT! Reason: {reason}")
+            log.info("🛑 [Gate] INTERRUPT! Reason: %s", reason)
         else:
-            print(f"🛑 [Gate] Interrupt requested but Nami wasn't speaking (reason: {reason})")
+            log.info("🛑 [Gate] Interrupt requested but Nami wasn't speaking (reason: %s)", reason)
 
         return was_speaking
 
@@ -180,16 +233,25 @@ class SpeechGate:
     # =================================================================
 
     def get_stats(self) -> Dict[str, Any]:
+        # Internal timestamps are monotonic; report wall-clock equivalents
+        now = time.monotonic()
+        wall_offset = time.time() - now
         return {
-            "nami_speaking": self.is_speaking(),
+            "nami_speaking": self._is_speaking(now),
             "awaiting_user_response": self.awaiting_user_response,
-            "in_cooldown": self.in_cooldown(),
+            "in_cooldown": self._in_cooldown(now),
             "total_interrupts": self.interrupt_count,
-            "last_interrupt_time": self.last_interrupt_time,
+            "last_interrupt_time": (
+                self.last_interrupt_time + wall_offset
+                if self.last_interrupt_time else 0.0
+            ),
             "seconds_since_interrupt": (
-                round(time.time() - self.last_interrupt_time, 1)
+                round(now - self.last_interrupt_time, 1)
                 if self.last_interrupt_time else None
             ),
-            "last_dispatch_time": self.last_dispatch_time,
+            "last_dispatch_time": (
+                self.last_dispatch_time + wall_offset
+                if self.last_dispatch_time else 0.0
+            ),
             "speech_source": self.last_speech_source,
         }
\ No newline at end of file